@@ -1,3 +1,5 @@
+import functools
+
 from sw_entities import EvacuationPlan, Garrison, MilitaryBase, \
     Person, Planet, Species, Starship
 import sw_utilities as utl
@@ -5,24 +7,84 @@ import sw_utilities as utl
 
 ENDPOINT = 'https://swapi.py4e.com/api'
 
-def create_person(data):
+# Attribute specs: (key, converter) pairs where the source data key doubles as
+# the attribute name and converter is None if the value is assigned as is.
+convert_str_to_comma_list = functools.partial(utl.convert_str_to_list, delimiter=', ')
+
+PERSON_SPEC = (
+    ('birth_year', None),
+    ('height', utl.convert_str_to_float),
+    ('mass', utl.convert_str_to_float)
+)
+
+PLANET_SPEC = (
+    ('gravity', None),
+    ('climate', convert_str_to_comma_list),
+    ('terrain', convert_str_to_comma_list),
+    ('surface_water', utl.convert_str_to_int),
+    ('population', utl.convert_str_to_int)
+)
+
+SPECIES_SPEC = (
+    ('classification', None),
+    ('designation', None),
+    ('language', None)
+)
+
+STARSHIP_SPEC = (
+    ('length', utl.convert_str_to_float),
+    ('max_atmosphering_speed', utl.convert_str_to_float),
+    ('hyperdrive_rating', utl.convert_str_to_float),
+    ('MGLT', utl.convert_str_to_int),
+    ('armament', convert_str_to_comma_list),
+    ('crew', utl.convert_str_to_int),
+    ('passengers', utl.convert_str_to_int),
+    ('consumables', None),
+    ('cargo_capacity', utl.convert_str_to_int)
+)
+
+def build_entity(entity, data, spec):
+    """Assigns dictionary data (a map) to an entity's attributes as
+    described by an attribute spec, converting values whenever the
+    spec provides a converter.
+
+    Parameters:
+        entity (Entity): instance to populate
+        data (dict): source data
+        spec (tuple): (key, converter) pairs
+
+    Returns:
+        entity: the populated instance
+    """
+
+    for key, converter in spec:
+        value = data[key]
+        setattr(entity, key, converter(value) if converter else value)
+
+    return entity
+
+def create_person(data, resources=None):
     """Creates a Person instance from dictionary data (a map),
     converting string values to the appropriate type whenever
-    possible.
+    possible. The person's homeworld and species are looked up in
+    the prefetched resources; any url not found there is retrieved
+    from SWAPI.
 
     Parameters:
         data (dict): source data
+        resources (dict): optional prefetched SWAPI representations
+                          keyed by url. The default value is None.
 
     Returns:
         person: new Person instance
     """
 
-    person = Person(data['url'], data['name'])
-    person.birth_year = data['birth_year']
-    person.height = utl.convert_str_to_float(data['height'])
-    person.mass = utl.convert_str_to_float(data['mass'])
-    person.homeworld = create_planet(utl.get_swapi_resource(data['homeworld']))
-    person.species = create_species(utl.get_swapi_resource(data['species'][0]))
+    if resources is None:
+        resources = {}
+
+    person = build_entity(Person(data['url'], data['name']), data, PERSON_SPEC)
+    person.homeworld = create_planet(get_resource(data['homeworld'], resources))
+    person.species = create_species(get_resource(data['species'][0], resources))
 
     return person
 
@@ -38,12 +100,25 @@ def create_planet(data):
         planet: new Planet instance
     """
 
-    planet = Planet(data['url'], data['name'])
-    planet.gravity = data['gravity']
-    planet.climate = utl.convert_str_to_list(data['climate'], ', ')
-    planet.terrain = utl.convert_str_to_list(data['terrain'], ', ')
-    planet.surface_water = utl.convert_str_to_int(data['surface_water'])
-    planet.population = utl.convert_str_to_int(data['population'])
+    return build_entity(Planet(data['url'], data['name']), data, PLANET_SPEC)
+
+def create_planet_dict(data):
+    """Creates a JSON-friendly planet dictionary from dictionary data
+    (a map), converting string values to the appropriate type whenever
+    possible. Equivalent to create_planet(data).jsonable() without the
+    intermediate Planet instance; use when the planet is only serialized.
+
+    Parameters:
+        data (dict): source data
+
+    Returns:
+        dict: planet dictionary
+    """
+
+    planet = {'url': data['url'], 'name': data['name']}
+    for key, converter in PLANET_SPEC:
+        value = data[key]
+        planet[key] = converter(value) if converter else value
 
     return planet
 
@@ -59,12 +134,7 @@ def create_species(data):
         species: new Species instance
     """
 
-    species = Species(data['url'], data['name'])
-    species.classification = data['classification']
-    species.designation = data['designation']
-    species.language = data['language']
-
-    return species
+    return build_entity(Species(data['url'], data['name']), data, SPECIES_SPEC)
 
 
 def create_starship(data):
@@ -81,17 +151,27 @@ def create_starship(data):
     """
 
     starship = Starship(data['url'], data['name'], data['model'], data['starship_class'])
-    starship.length = utl.convert_str_to_float(data['length'])
-    starship.max_atmosphering_speed = utl.convert_str_to_float(data['max_atmosphering_speed'])
-    starship.hyperdrive_rating = utl.convert_str_to_float(data['hyperdrive_rating'])
-    starship.MGLT = utl.convert_str_to_int(data['MGLT'])
-    starship.armament = utl.convert_str_to_list(data['armament'], ', ')
-    starship.crew = utl.convert_str_to_int(data['crew'])
-    starship.passengers = utl.convert_str_to_int(data['passengers'])
-    starship.consumables = data['consumables']
-    starship.cargo_capacity = utl.convert_str_to_int(data['cargo_capacity'])
 
-    return starship
+    return build_entity(starship, data, STARSHIP_SPEC)
+
+
+def get_resource(url, resources):
+    """Returns the representation of a SWAPI resource from the prefetched
+    resources, falling back to an HTTP GET request if the url was not
+    prefetched.
+
+    Parameters:
+        url (str): a url that specifies the resource.
+        resources (dict): prefetched SWAPI representations keyed by url.
+
+    Returns:
+        dict: dictionary representation of the decoded JSON.
+    """
+
+    if url in resources:
+        return resources[url]
+
+    return utl.get_swapi_resource(url)
 
 
 def main():
@@ -127,45 +207,73 @@ def main():
     swapi_people_url = f"{ENDPOINT}/people/"
     swapi_planets_url = f"{ENDPOINT}/planets"
     swapi_starships_url = f"{ENDPOINT}/starships/"
+    swapi_han_url = f"{ENDPOINT}/people/14/"
+    swapi_chewbacca_url = f"{ENDPOINT}/people/13/"
+
+    # Prefetch SWAPI resources concurrently rather than one round-trip at a time
+
+    resources = utl.get_swapi_resources([
+        swapi_people_url,
+        swapi_planets_url,
+        swapi_starships_url,
+        swapi_han_url,
+        swapi_chewbacca_url
+    ])
+    swapi_people = resources[swapi_people_url]['results']
+    swapi_starships = resources[swapi_starships_url]['results']
+
+    echo_base_data = utl.read_json('sw_echo_base-v1p0.json')
+    crew_data = utl.read_json('sw_bright_hope_crew.json')
+    csv_rows = utl.read_csv_as_dict('sw_echo_base_transport_craft.csv', ',')
+
+    people_data = [
+        swapi_people[0], # Luke Skywalker
+        swapi_people[1], # C-3PO
+        swapi_people[2], # R2-D2
+        swapi_people[4], # Leia Organa
+        resources[swapi_han_url],
+        resources[swapi_chewbacca_url],
+        echo_base_data['garrison']['commander'],
+        crew_data['pilot'],
+        crew_data['co-pilot'],
+        crew_data['navigator']
+    ]
+    resources.update(utl.get_swapi_resources(
+        [url for person in people_data for url in (person['homeworld'], person['species'][0])]
+    ))
 
     # 8.2 WARMUP: Locate uninhabited planets
 
-    swapi_planets = utl.read_json('sw_planets-v1p0.json')
-    uninhabited = []
-    for planet_dictionary in swapi_planets:
-        population = planet_dictionary['population']
-
-        if utl.is_unknown(population):
-            planet_instance = create_planet(planet_dictionary) # create an instance of that planet
-            uninhabited.append(planet_instance)
-    utl.write_custom_json('sw_uninhabited_planets.json', uninhabited)
+    swapi_planets = utl.iter_json_items('sw_planets-v1p0.json')
+    uninhabited = (
+        create_planet_dict(planet) for planet in swapi_planets if utl.is_unknown(planet['population'])
+    )
+    utl.write_custom_json_items('sw_uninhabited_planets.json', uninhabited) # single streaming pass
 
 
     # 8.3 TEST CODE: Create an Echo Base person
-    leia_organa = create_person(utl.get_swapi_resource(swapi_people_url)['results'][4])
+    leia_organa = create_person(swapi_people[4], resources)
     utl.write_custom_json('test_leia.json', leia_organa)
 
     # 8.4 TEST CODE: Create an Echo Base starship
-    swapi_x_wing = utl.get_swapi_resource(swapi_starships_url)['results'][6]
-    csv_x_wing = utl.read_csv_as_dict('sw_echo_base_transport_craft.csv', ',')[0]
+    swapi_x_wing = swapi_starships[6]
+    csv_x_wing = csv_rows[0]
     x_wing_combined = utl.combine_data(swapi_x_wing, csv_x_wing)
     x_wing_instance = create_starship(x_wing_combined)
     utl.write_custom_json('test_x_wing.json', x_wing_instance)
 
     # 8.5 Echo Base evacuation plan
 
-    echo_base_data = utl.read_json('sw_echo_base-v1p0.json') # read file
-
     # 8.5.1 echo_base MiltaryBase
 
     echo_base = MilitaryBase(echo_base_data['url'], echo_base_data['name']) # instantiate MiltaryBase instance
 
-    planet_instance = create_planet(utl.get_swapi_resource(swapi_planets_url)['results'][3])
+    planet_instance = create_planet(resources[swapi_planets_url]['results'][3])
     planet_instance.url = echo_base_data['planet']['url']
     echo_base.location = planet_instance
 
     garrison_instance = Garrison(echo_base_data['garrison']['url'], echo_base_data['garrison']['name'])
-    person_instance = create_person(echo_base_data['garrison']['commander'])
+    person_instance = create_person(echo_base_data['garrison']['commander'], resources)
     garrison_instance.commander = person_instance
     garrison_instance.personnel = echo_base_data['garrison']['personnel']
     echo_base.garrison = garrison_instance
@@ -192,16 +300,15 @@ def main():
     evac_plan_instance.transport_escorts = echo_base_data['evacuation_plan']['transport_escorts']
 
     # 8.5.3 gr_75_transport Starship
-    swapi_gr_75 = utl.get_swapi_resource(swapi_starships_url)['results'][-1]
-    csv_gr_75 = utl.read_csv_as_dict('sw_echo_base_transport_craft.csv', ',')[-2]
+    swapi_gr_75 = swapi_starships[-1]
+    csv_gr_75 = csv_rows[-2]
     gr_75_combined = utl.combine_data(swapi_gr_75, csv_gr_75)
     gr_75_combined['name'] = 'Bright Hope'
     gr_75_instance = create_starship(gr_75_combined)
 
-    crew_data = utl.read_json('sw_bright_hope_crew.json')
-    pilot_instance = create_person(crew_data['pilot'])
-    co_pilot_instance = create_person(crew_data['co-pilot'])
-    navigator_instance = create_person(crew_data['navigator'])
+    pilot_instance = create_person(crew_data['pilot'], resources)
+    co_pilot_instance = create_person(crew_data['co-pilot'], resources)
+    navigator_instance = create_person(crew_data['navigator'], resources)
     
     crew1 = {
         'pilot': pilot_instance,
@@ -210,21 +317,19 @@ def main():
     }
     gr_75_instance.assign_crew(crew1)
 
-    C_3PO_person = create_person(utl.get_swapi_resource(swapi_people_url)['results'][1])
+    C_3PO_person = create_person(swapi_people[1], resources)
 
     manifest = [leia_organa, C_3PO_person]
     gr_75_instance.assign_passengers(manifest)
     
     evac_plan_instance.transport_assignments.append(gr_75_instance)
 
-    # 8.5.4 x_wing Starship
-    swapi_x_wing = utl.get_swapi_resource(swapi_starships_url)['results'][6]
-    csv_x_wing = utl.read_csv_as_dict('sw_echo_base_transport_craft.csv', ',')[0]
-    x_wing_combined = utl.combine_data(swapi_x_wing, csv_x_wing)
-    x_wing_instance = create_starship(x_wing_combined)
-    
-    luke_person = create_person(utl.get_swapi_resource(swapi_people_url)['results'][0])
-    R2_D2_person = create_person(utl.get_swapi_resource(swapi_people_url)['results'][2])
+    # 8.5.4 x_wing Starship (reuses the 8.4 x_wing_instance)
+    x_wing_instance.crew_members.clear()
+    x_wing_instance.passenger_manifest.clear()
+
+    luke_person = create_person(swapi_people[0], resources)
+    R2_D2_person = create_person(swapi_people[2], resources)
     crew2 = {
         'pilot': luke_person,
         'astromech_droid': R2_D2_person
@@ -234,13 +339,13 @@ def main():
     evac_plan_instance.transport_escorts.append(x_wing_instance)
 
     # 8.5.5 m_falcon Starship
-    swapi_mill_falcon = utl.get_swapi_resource(swapi_starships_url)['results'][4]
-    csv_mill_falcon = utl.read_csv_as_dict('sw_echo_base_transport_craft.csv', ',')[-1]
+    swapi_mill_falcon = swapi_starships[4]
+    csv_mill_falcon = csv_rows[-1]
     mill_falcon_combined = utl.combine_data(swapi_mill_falcon, csv_mill_falcon)
     mill_falcon_instance = create_starship(mill_falcon_combined)
     
-    han_person = create_person(utl.get_swapi_resource("https://swapi.py4e.com/api/people/14/"))
-    chewbacca_person = create_person(utl.get_swapi_resource("https://swapi.py4e.com/api/people/13/"))
+    han_person = create_person(resources[swapi_han_url], resources)
+    chewbacca_person = create_person(resources[swapi_chewbacca_url], resources)
     crew3 = {
         'pilot': han_person,
         'co-pilot': chewbacca_person
@@ -251,10 +356,7 @@ def main():
 
 
     # 8.5.6 Evacuation arithmetic
-    garrison_personnel_count = 0
-    for value in echo_base_data['garrison']['personnel'].values():
-        garrison_personnel_count += value
-    evac_plan_instance.garrison_personnel_count = utl.convert_str_to_int(garrison_personnel_count)
+    evac_plan_instance.garrison_personnel_count = sum(echo_base_data['garrison']['personnel'].values())
 
     evac_plan_instance.num_available_transports = int(30)
 
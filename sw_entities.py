@@ -1,3 +1,6 @@
+import operator
+
+
 class Entity:
     """Minimal representation of a thing or entity.
 
@@ -5,19 +8,63 @@ class Entity:
         url: resource identifier
         name: common name
 
+    Subclasses declare their remaining attributes in a _DEFAULTS map of
+    {<attribute>: <factory>}, where factory is None or a container type
+    (e.g., list). Attributes are not assigned at instantiation; an unset
+    attribute is assigned its default on first access.
+
     Methods:
         jsonable: return JSON-friendly dict representation of the object
     """
 
+    _DEFAULTS = {}
+    __slots__ = ('url', 'name')
+
+    _JSON_KEYS = ('url', 'name')
+    _JSON_GET = operator.attrgetter(*_JSON_KEYS)
+
+    def __init_subclass__(cls, **kwargs):
+        """Merge the subclass's attribute defaults with those it inherits."""
+
+        super().__init_subclass__(**kwargs)
+        defaults = {}
+        for base in reversed(cls.__mro__[1:]):
+            defaults.update(base.__dict__.get('_DEFAULTS', {}))
+        defaults.update(cls.__dict__.get('_DEFAULTS', {}))
+        cls._DEFAULTS = defaults
+
     def __init__(self, url, name):
 
         self.url = url
         self.name = name
 
+    def __getattr__(self, name):
+        """Called only when an attribute is unset. Assigns and returns the
+        attribute's default, creating a new container if required.
+
+        Parameters:
+            name (str): attribute name
+
+        Returns:
+            object: the attribute's default value
+        """
+
+        try:
+            factory = type(self)._DEFAULTS[name]
+        except KeyError:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'") from None
+
+        value = factory() if factory else None
+        setattr(self, name, value)
+
+        return value
+
     def jsonable(self):
         """Return a JSON-friendly representation of the object.
-        Use a dictionary literal rather than built-in dict() to avoid
-        built-in lookup costs.
+        Pair the class's _JSON_KEYS with the values fetched in a single
+        call to its _JSON_GET attrgetter rather than build a dictionary
+        literal attribute by attribute. Subclasses override the two class
+        attributes rather than this method.
 
         Do not simply return self.__dict__. It can be intercepted and
         mutated, adding, modifying or removing instance attributes as a
@@ -33,7 +80,7 @@ class Entity:
         # return self.__dict__ # DANGEROUS
         # return copy.deepcopy(self.__dict__) # safe but slow
 
-        return {"url":self.url, "name": self.name}
+        return dict(zip(self._JSON_KEYS, self._JSON_GET(self)))
 
     def __str__(self):
         """Human-readable string representation of the object."""
@@ -70,44 +117,33 @@ class EvacuationPlan(Entity):
         jsonable: return JSON-friendly dict representation of the object
     """
 
-    def __init__(self, url, name):
-
-        super().__init__(url, name)
-        self.classification = None
-        self.year_era = None
-        self.description = None
-        self.garrison_personnel_count = None
-        self.num_available_transports = None
-        self.passenger_overload_multiplier = None
-        self.max_passenger_overload_capacity = None
-        self.transport_assignments = []
-        self.transport_escorts = []
-
-    def jsonable(self):
-        """Return a JSON-friendly representation of the object.
-        Use a dictionary literal rather than built-in dict() to avoid
-        built-in lookup costs.
-
-        Parameters:
-            None
-
-        Returns:
-            dict: dictionary of the object's instance variable values
-        """
-
-        return {
-                "name": self.name,
-                "url": self.url,
-                "classification": self.classification,
-                "year_era": self.year_era,
-                "description": self.description,
-                "garrison_personnel_count": self.garrison_personnel_count,
-                "num_available_transports": self.num_available_transports,
-                "passenger_overload_multiplier": self.passenger_overload_multiplier,
-                "max_passenger_overload_capacity": self.max_passenger_overload_capacity,
-                "transport_assignments": self.transport_assignments,
-                "transport_escorts": self.transport_escorts
-        }
+    _DEFAULTS = {
+        'classification': None,
+        'year_era': None,
+        'description': None,
+        'garrison_personnel_count': None,
+        'num_available_transports': None,
+        'passenger_overload_multiplier': None,
+        'max_passenger_overload_capacity': None,
+        'transport_assignments': list,
+        'transport_escorts': list
+    }
+    __slots__ = tuple(_DEFAULTS)
+
+    _JSON_KEYS = (
+        'name',
+        'url',
+        'classification',
+        'year_era',
+        'description',
+        'garrison_personnel_count',
+        'num_available_transports',
+        'passenger_overload_multiplier',
+        'max_passenger_overload_capacity',
+        'transport_assignments',
+        'transport_escorts'
+    )
+    _JSON_GET = operator.attrgetter(*_JSON_KEYS)
 
     def __str__(self):
         """Human-readable string representation of the object."""
@@ -129,29 +165,19 @@ class Garrison(Entity):
         jsonable: return JSON-friendly dict representation of the object
     """
 
-    def __init__(self, url, name):
-        super().__init__(url, name)
-        self.commander = None
-        self.personnel = {}
-
-    def jsonable(self):
-        """Return a JSON-friendly representation of the object.
-        Use a dictionary literal rather than built-in dict() to avoid
-        built-in lookup costs.
-
-        Parameters:
-            None
-
-        Returns:
-            dict: dictionary of the object's instance variable values
-        """
+    _DEFAULTS = {
+        'commander': None,
+        'personnel': dict
+    }
+    __slots__ = tuple(_DEFAULTS)
 
-        return {
-                'url': self.url,
-                'name': self.name,
-                'commander': self.commander,
-                'personnel': self.personnel
-            }
+    _JSON_KEYS = (
+        'url',
+        'name',
+        'commander',
+        'personnel'
+    )
+    _JSON_GET = operator.attrgetter(*_JSON_KEYS)
 
     def __str__(self):
         """Human-readable string representation of the object."""
@@ -177,39 +203,29 @@ class MilitaryBase(Entity):
         jsonable: return JSON-friendly dict representation of the object
     """
 
-    def __init__(self, url, name):
-        super().__init__(url, name)
-        self.location = None
-        self.operational_status = None
-        self.facilities = []
-        self.fixed_defenses = []
-        self.garrison = None
-        self.air_space_assets = []
-        self.evacuation_plan = None
-        
-    def jsonable(self):
-        """Return a JSON-friendly representation of the object.
-        Use a dictionary literal rather than built-in dict() to avoid
-        built-in lookup costs.
-
-        Parameters:
-            None
-
-        Returns:
-            dict: dictionary of the object's instance variable values
-        """
-
-        return {
-                "name": self.name,
-                "url": self.url,
-                "operational_status": self.operational_status,
-                "location": self.location,
-                "facilities": self.facilities,
-                "garrison": self.garrison,
-                "fixed_defenses": self.fixed_defenses,
-                "air_space_assets": self.air_space_assets,
-                "evacuation_plan": self.evacuation_plan
-        }
+    _DEFAULTS = {
+        'location': None,
+        'operational_status': None,
+        'facilities': list,
+        'fixed_defenses': list,
+        'garrison': None,
+        'air_space_assets': list,
+        'evacuation_plan': None
+    }
+    __slots__ = tuple(_DEFAULTS)
+
+    _JSON_KEYS = (
+        'name',
+        'url',
+        'operational_status',
+        'location',
+        'facilities',
+        'garrison',
+        'fixed_defenses',
+        'air_space_assets',
+        'evacuation_plan'
+    )
+    _JSON_GET = operator.attrgetter(*_JSON_KEYS)
 
     def __str__(self):
         """Human-readable string representation of the object."""
@@ -234,37 +250,25 @@ class Person(Entity):
         jsonable: return JSON-friendly dict representation of the object
     """
 
-    def __init__(self, url, name):
-
-        super().__init__(url, name)
-
-        self.birth_year = None
-        self.height = None
-        self.mass = None
-        self.homeworld = None
-        self.species = None
-
-    def jsonable(self):
-        """Return a JSON-friendly representation of the object.
-        Use a dictionary literal rather than built-in dict() to avoid
-        built-in lookup costs.
-
-        Parameters:
-            None
-
-        Returns:
-            dict: dictionary of the object's instance variable values
-        """
-
-        return {
-                "url": self.url,
-                "name": self.name,
-                "birth_year": self.birth_year,
-                "height": self.height,
-                "mass": self.mass,
-                "homeworld": self.homeworld,
-                "species": self.species
-        }
+    _DEFAULTS = {
+        'birth_year': None,
+        'height': None,
+        'mass': None,
+        'homeworld': None,
+        'species': None
+    }
+    __slots__ = tuple(_DEFAULTS)
+
+    _JSON_KEYS = (
+        'url',
+        'name',
+        'birth_year',
+        'height',
+        'mass',
+        'homeworld',
+        'species'
+    )
+    _JSON_GET = operator.attrgetter(*_JSON_KEYS)
 
     def __str__(self):
         """Human-readable string representation of the object."""
@@ -291,36 +295,25 @@ class Planet(Entity):
         jsonable: return JSON-friendly dict representation of the object
     """
 
-    def __init__(self, url, name):
-
-        super().__init__(url, name)
-        self.gravity = None
-        self.climate = []
-        self.terrain = []
-        self.surface_water = None
-        self.population = None
-
-    def jsonable(self):
-        """Return a JSON-friendly representation of the object.
-        Use a dictionary literal rather than built-in dict() to avoid
-        built-in lookup costs.
-
-        Parameters:
-            None
-
-        Returns:
-            dict: dictionary of the object's instance variable values
-        """
-
-        return {
-                "url": self.url,
-                "name": self.name,
-                "gravity": self.gravity,
-                "climate": self.climate,
-                "terrain": self.terrain,
-                "surface_water": self.surface_water,
-                "population": self.population
-        }
+    _DEFAULTS = {
+        'gravity': None,
+        'climate': list,
+        'terrain': list,
+        'surface_water': None,
+        'population': None
+    }
+    __slots__ = tuple(_DEFAULTS)
+
+    _JSON_KEYS = (
+        'url',
+        'name',
+        'gravity',
+        'climate',
+        'terrain',
+        'surface_water',
+        'population'
+    )
+    _JSON_GET = operator.attrgetter(*_JSON_KEYS)
 
     def __str__(self):
         """Human-readable string representation of the object."""
@@ -342,33 +335,21 @@ class Species(Entity):
         jsonable: return JSON-friendly dict representation of the object.
     """
 
-    def __init__(self, url, name):
-
-        super().__init__(url, name)
-        self.classification = None
-        self.designation = None
-        self.language = None
-
-
-    def jsonable(self):
-        """Return a JSON-friendly representation of the object.
-        Use a dictionary literal rather than built-in dict() to avoid
-        built-in lookup costs.
-
-        Parameters:
-            None
-
-        Returns:
-            dict: dictionary of the object's instance variable values
-        """
-
-        return {
-                "url": self.url,
-                "name": self.name,
-                "classification": self.classification,
-                "designation": self.designation,
-                "language": self.language
-        }
+    _DEFAULTS = {
+        'classification': None,
+        'designation': None,
+        'language': None
+    }
+    __slots__ = tuple(_DEFAULTS)
+
+    _JSON_KEYS = (
+        'url',
+        'name',
+        'classification',
+        'designation',
+        'language'
+    )
+    _JSON_GET = operator.attrgetter(*_JSON_KEYS)
 
     def __str__(self):
         """Human-readable string representation of the object."""
@@ -405,24 +386,46 @@ class Starship(Entity):
         jsonable: return JSON-friendly dict representation of the object.
     """
 
+    _DEFAULTS = {
+        'length': None,
+        'max_atmosphering_speed': None,
+        'hyperdrive_rating': None,
+        'MGLT': None,
+        'armament': list,
+        'crew': None,
+        'passengers': None,
+        'consumables': None,
+        'cargo_capacity': None,
+        'crew_members': dict,
+        'passenger_manifest': list
+    }
+    __slots__ = ('model', 'starship_class', *_DEFAULTS)
+
+    _JSON_KEYS = (
+        'url',
+        'name',
+        'model',
+        'starship_class',
+        'length',
+        'max_atmosphering_speed',
+        'hyperdrive_rating',
+        'MGLT',
+        'armament',
+        'crew',
+        'passengers',
+        'consumables',
+        'cargo_capacity',
+        'crew_members',
+        'passenger_manifest'
+    )
+    _JSON_GET = operator.attrgetter(*_JSON_KEYS)
+
     def __init__(self, url, name, model, starship_class):
 
         super().__init__(url, name)
 
         self.model = model
         self.starship_class = starship_class
-        self.length = None
-        self.max_atmosphering_speed = None
-        self.hyperdrive_rating = None
-        self.MGLT = None
-        self.armament = []
-        self.crew = None
-        self.passengers = None
-        self.consumables = None
-        self.cargo_capacity = None
-        self.crew_members = {}
-        self.passenger_manifest = []
-
 
     def assign_crew(self, crew):
         """Assign crew member(s) by role to a starship or a vehicle.
@@ -450,36 +453,6 @@ class Starship(Entity):
 
         self.passenger_manifest.extend(manifest)
 
-    def jsonable(self):
-        """Return a JSON-friendly representation of the object.
-        Use a dictionary literal rather than built-in dict() to avoid
-        built-in lookup costs.
-
-        Parameters:
-            None
-
-        Returns:
-            dict: dictionary of the object's instance variable values
-        """
-        return {
-                "url" : self.url,
-                "name" : self.name,
-                "model" : self.model,
-                "starship_class" : self.starship_class,
-                "length" : self.length,
-                "max_atmosphering_speed" : self.max_atmosphering_speed,
-                "hyperdrive_rating" : self.hyperdrive_rating,
-                "MGLT" : self.MGLT,
-                "armament" : self.armament,
-                "crew" : self.crew,
-                "passengers" : self.passengers,
-                "consumables" : self.consumables,
-                "cargo_capacity" : self.cargo_capacity,
-                "crew_members" : self.crew_members,
-                "passenger_manifest" : self.passenger_manifest
-        }
-        
-
     def __str__(self):
         """Human-readable string representation of the object."""
 
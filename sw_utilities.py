@@ -1,65 +1,164 @@
+import asyncio
 import copy
 import csv
+import functools
 import json
+import mmap
+import os
+import re
 import requests
+import stat
+import threading
 
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-class CustomEncoder(json.JSONEncoder):
-    """WARNING: DO NOT MODIFY.
+try:
+    import ijson
+except ImportError: # fall back to read_json()
+    ijson = None
 
-    Extends the json module's JSONEncoder class in order to serialize
-    composite class instances.
+try:
+    import orjson
+except ImportError: # fall back to the json module
+    orjson = None
 
-     Note: include the pylint disable comment as Windows users have
-     reported issues when the default() method is called.
+try:
+    from requests_cache import CachedSession
+except ImportError: # persistent HTTP cache is optional
+    CachedSession = None
 
-     Methods:
-        default: overrides default method
-     """
 
-    def default(self, obj): # pylint: disable=E0202
-        """Check object is provisioned with a jsonable method that is
-        callable. If yes override default serialization handling.
+# orjson only writes floats in this range as float.__repr__ (and json) does
+_ORJSON_FLOAT_MIN = 1e-4
+_ORJSON_FLOAT_MAX = 1e16
+
+# orjson only encodes ints in this range
+_ORJSON_INT_MIN = -2 ** 63
+_ORJSON_INT_MAX = 2 ** 64 - 1
+
+# integer literals this long may fall outside the 64-bit range orjson decodes as int
+_LONG_DIGITS = re.compile(rb'\d{19}')
+
+UNKNOWN_VALUES = frozenset(('n/a', 'N/A', 'unknown', 'Unknown', 'UNKNOWN')) # lowercase forms required
+
+CSV_ARROW_MIN_SIZE = 64000 # bytes; larger CSV files are parsed with pyarrow if installed
+
+SWAPI_CACHE_NAME = 'swapi_cache' # sqlite file: swapi_cache.sqlite
+SWAPI_CACHE_EXPIRE_AFTER = 86400 # seconds
+
+SWAPI_MEMO_SIZE = 4096 # representations memoized by get_swapi_resource()
+_SWAPI_MEMO = {} # (url, params) -> decoded JSON, oldest first
+_SWAPI_MEMO_LOCK = threading.Lock()
+
+if CachedSession:
+    _SESSION = CachedSession(SWAPI_CACHE_NAME, backend='sqlite', expire_after=SWAPI_CACHE_EXPIRE_AFTER)
+else:
+    _SESSION = requests.Session()
+
+# Keep-alive connection pool sized for get_swapi_resources() concurrency
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.2)
+))
+
+
+def _jsonable_default(obj):
+    """Serialization hook passed as default= to json and orjson in order to
+    serialize composite class instances. Check object is provisioned with a
+    jsonable method and call it; if not, raise a TypeError as the json
+    module does for unsupported types.
+
+    Parameters:
+        obj (object): class instance
+
+    Returns:
+        dict: dictionary representation of the object
+    """
 
-        Parameters:
-            obj (object): class instance
+    jsonable = getattr(obj, 'jsonable', None) # single lookup; bound method or None
+    if jsonable is not None:
+        return jsonable()
+    else:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+async def aget_swapi_resource(url, params=None, timeout=20):
+    """
+    Coroutine counterpart of get_swapi_resource() for asyncio callers. The blocking
+    request runs in a worker thread so the event loop is free to await other requests
+    concurrently, e.g., asyncio.gather(*(aget_swapi_resource(url) for url in urls)).
+    Shares get_swapi_resource()'s connection pool and memoized representations.
 
-        Returns:
-            dict: dictionary representation of the object
-        """
+    Parameters:
+        url (str): a url that specifies the resource.
+        params (dict): optional dictionary of querystring arguments. The default value is None.
+        timeout (int): timeout value in seconds. The default value is 20
+
+    Returns:
+        dict: dictionary representation of the decoded JSON.
+    """
 
-        if hasattr(obj, 'jsonable') and callable(obj.jsonable):
-            return obj.jsonable()
-        else:
-            return json.JSONEncoder.default(self, obj)
+    return await asyncio.to_thread(get_swapi_resource, url, params, timeout)
 
 
-def combine_data(default_data, override_data):
-    """Create a deep copy of the default dictionary then update the copy with
-    a second 'override' dictionary. A deep copy constructs a new compound object
-    and then, recursively, inserts copies (rather than references) into it of the
-    objects found in the original.
+def combine_data(default_data, override_data, deep=False):
+    """Create a new dictionary from the default dictionary's key-value pairs
+    updated with those of a second 'override' dictionary. By default the merge
+    is shallow: the new dictionary references (rather than copies) the values
+    found in the originals. Pass deep=True to first create a deep copy of the
+    default dictionary; a deep copy constructs a new compound object and then,
+    recursively, inserts copies (rather than references) into it of the objects
+    found in the original.
 
     Parameters:
         default_data (dict): key-value pairs that provide a collection of default values.
         override_data (dict): key-value pairs that are intended to override default values
                               and/or add new key-value pairs.
+        deep (bool): deep copy the default values. The default value is False.
 
     Returns:
         dict: dictionary with updated key-value pairs.
     """
 
-    data = copy.deepcopy(default_data)
-    data.update(override_data)
+    if deep:
+        data = copy.deepcopy(default_data)
+        data.update(override_data)
 
-    return data
+        return data
+
+    return {**default_data, **override_data}
 
 
 def convert_str_to_float(value):
     """Attempts to convert a string to a float. If unsuccessful returns
     the value unchanged. Note that this function will return True for
     boolean values, faux string boolean values (e.g., "true"), "NaN",
-    exponential notation, etc.
+    exponential notation, etc. String conversions are memoized.
+    Parameters:
+        value (str): string to be converted.
+
+    Returns:
+        float: if string successfully converted else returns value as is
+    """
+
+    if type(value) is str:
+        return _convert_str_to_float(value)
+    if type(value) is float:
+        return value
+
+    try:
+        return float(value)
+    except (ValueError, TypeError, OverflowError):
+        return value
+
+
+@functools.lru_cache(maxsize=4096)
+def _convert_str_to_float(value):
+    """Memoized string conversion underlying convert_str_to_float().
+
     Parameters:
         value (str): string to be converted.
 
@@ -67,9 +166,13 @@ def convert_str_to_float(value):
         float: if string successfully converted else returns value as is
     """
 
+    lead = value[:1]
+    if not lead or not (lead in '+-.nNiI' or lead.isdigit() or lead.isspace()):
+        return value # e.g., '', 'unknown'; cannot parse as a float
+
     try:
         return float(value)
-    except:
+    except ValueError:
         return value
 
 
@@ -77,7 +180,29 @@ def convert_str_to_int(value):
     """Attempts to convert a string to an int. If unsuccessful returns
     the value unchanged. Note that this function will return True for
     boolean values, faux string boolean values (e.g., "true"), "NaN",
-    exponential notation, etc.
+    exponential notation, etc. String conversions are memoized.
+    Parameters:
+        value (str): string to be converted.
+
+    Returns:
+        int: if string successfully converted else returns value as is.
+    """
+
+    if type(value) is str:
+        return _convert_str_to_int(value)
+    if type(value) is int:
+        return value
+
+    try:
+        return int(value)
+    except (ValueError, TypeError, OverflowError):
+        return value
+
+
+@functools.lru_cache(maxsize=4096)
+def _convert_str_to_int(value):
+    """Memoized string conversion underlying convert_str_to_int().
+
     Parameters:
         value (str): string to be converted.
 
@@ -85,15 +210,21 @@ def convert_str_to_int(value):
         int: if string successfully converted else returns value as is.
     """
 
+    lead = value[:1]
+    if not lead or not (lead in '+-' or lead.isdigit() or lead.isspace()):
+        return value # e.g., '', 'unknown', 'n/a'; cannot parse as an int
+
     try:
         return int(value)
-    except:
+    except ValueError:
         return value
 
 
 def convert_str_to_list(value, delimiter):
     """
-    Splits a string using the provided delimiter.
+    Splits a string using the provided delimiter. If unsuccessful returns
+    the value unchanged. String splits are memoized on (value, delimiter);
+    each call returns a new list.
 
     Parameters:
         value (str): string to be split.
@@ -104,40 +235,130 @@ def convert_str_to_list(value, delimiter):
 
     """
 
+    if type(value) is str and (delimiter is None or type(delimiter) is str):
+        items = _split_str(value, delimiter)
+        return list(items) if type(items) is tuple else items
+
     try:
         return value.split(delimiter)
-    except:
+    except (AttributeError, TypeError, ValueError):
+        return value
+
+
+@functools.lru_cache(maxsize=4096)
+def _split_str(value, delimiter):
+    """Memoized split underlying convert_str_to_list(). Returns an immutable
+    tuple so that cached results cannot be mutated by callers.
+
+    Parameters:
+        value (str): string to be split.
+        delimiter (str): delimiter used to split the string.
+
+    Returns:
+         tuple: a string converted to a tuple.
+    """
+
+    try:
+        return tuple(value.split(delimiter))
+    except ValueError: # empty delimiter
         return value
 
 
 def get_swapi_resource(url, params=None, timeout=20):
     """
     This function initiates an HTTP GET request to the SWAPI service in order to return a
-    representation of a resource.
+    representation of a resource. Representations are memoized by url and querystring
+    arguments so that a resource is only requested once; treat the returned dictionary
+    as read-only. Requests share a keep-alive connection pool and are retried on
+    transient failures. If requests-cache is installed, responses are also persisted
+    to an on-disk SQLite cache so that subsequent runs avoid the network.
 
     Parameters:
         url (str): a url that specifies the resource.
         params (dict): optional dictionary of querystring arguments. The default value is None.
-        timeout (int): timeout value in seconds. The default value is 5
+        timeout (int): timeout value in seconds. The default value is 20
 
     Returns:
         dict: dictionary representation of the decoded JSON.
     """
 
-    if params:
-        response = requests.get(url,params)
-        dict = response.json()
-
+    if not params:
+        params = None
     else:
-        response = requests.get(url)
-        dict = response.json()
-        
-    return dict
+        try:
+            if isinstance(params, dict): # hashable memo key; list values become tuples
+                params = tuple(sorted(
+                    (key, tuple(value) if isinstance(value, list) else value) for key, value in params.items()
+                ))
+            hash(params)
+        except TypeError: # unhashable or unorderable querystring arguments; skip the memo
+            return _get_swapi_resource(url, params, timeout)
+
+    key = (url, params) # timeout is a transport setting, not part of the resource
+    try:
+        return _SWAPI_MEMO[key]
+    except KeyError:
+        pass
+
+    data = _get_swapi_resource(url, params, timeout)
+    with _SWAPI_MEMO_LOCK:
+        if key not in _SWAPI_MEMO:
+            if len(_SWAPI_MEMO) >= SWAPI_MEMO_SIZE:
+                del _SWAPI_MEMO[next(iter(_SWAPI_MEMO))] # evict the oldest
+            _SWAPI_MEMO[key] = data
+
+    return data
+
+
+def _get_swapi_resource(url, params, timeout):
+    """HTTP GET request underlying get_swapi_resource(), called on a memo miss.
+
+    Parameters:
+        url (str): a url that specifies the resource.
+        params (tuple): querystring arguments as sorted (key, value) pairs, any other
+                        value accepted by requests, or None.
+        timeout (int): timeout value in seconds.
+
+    Returns:
+        dict: dictionary representation of the decoded JSON.
+    """
+
+    response = _SESSION.get(url, params=params, timeout=timeout) # params=None is a no-op
+    data = response.json()
+
+    return data
+
+
+def get_swapi_resources(urls, params=None, timeout=20, max_workers=16):
+    """
+    This function initiates concurrent HTTP GET requests to the SWAPI service in order
+    to return representations of several resources. Duplicate urls are requested once.
+
+    Parameters:
+        urls (list): urls that specify the resources.
+        params (dict): optional dictionary of querystring arguments. The default value is None.
+        timeout (int): timeout value in seconds. The default value is 20
+        max_workers (int): maximum number of concurrent requests. The default value is 16
+
+    Returns:
+        dict: dictionary representations of the decoded JSON keyed by url, in input order.
+    """
+
+    urls = list(dict.fromkeys(urls))
+    if not urls:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+        resources = executor.map(lambda url: get_swapi_resource(url, params, timeout), urls)
+
+        return {url: resource for url, resource in zip(urls, resources)}
 
 
 def is_unknown(value):
     """Performs a membership test for string values that equal 'unknown'
-    or 'n/a'. Returns True if a match is obtained.
+    or 'n/a', ignoring case and surrounding whitespace. Returns True if a
+    match is obtained. Common spellings match with a single set lookup;
+    only other strings are normalized. Non-string values never match.
 
     Parameters:
         value (str): string to be evaluated
@@ -145,39 +366,192 @@ def is_unknown(value):
     Returns:
         bool: returns True if string match is obtained
     """
-    unknown_values = ('n/a','unknown')
-    if value.lower().strip() in unknown_values:
+
+    if not isinstance(value, str):
+        return False
+    if type(value) is str and value in UNKNOWN_VALUES:
         return True
+
+    return value.strip().lower() in UNKNOWN_VALUES
+
+
+def iter_csv_as_dict(path, delimiter=','):
+    """Accepts a path, creates a file object, and yields dictionaries that
+    represent the row values one at a time without buffering the file
+    contents. Rows match those of csv.DictReader but are built directly
+    from csv.reader rows and a header read once.
+
+    Parameters:
+        path (str): path to file
+        delimiter (str): delimiter that overrides the default delimiter
+
+    Returns:
+        generator: dictionaries representing the file rows
+     """
+
+    with open(path, 'r', newline='', encoding='utf-8') as csv_file:
+        reader = csv.reader(csv_file, delimiter=delimiter)
+        header = next(reader, None)
+        if header is None:
+            return
+
+        width = len(header)
+        for row in reader:
+            if not row: # csv.DictReader skips blank rows
+                continue
+            if len(row) == width:
+                yield dict(zip(header, row))
+            else: # ragged row; mirror csv.DictReader (restkey=None, restval=None)
+                line = dict(zip(header, row))
+                if len(row) > width:
+                    line[None] = row[width:]
+                else:
+                    line.update(dict.fromkeys(header[len(row):]))
+                yield line
+
+
+def iter_json_items(filepath, prefix='item'):
+    """
+    This function streams the values of a JSON document found at an ijson-style prefix,
+    yielding one decoded value at a time. Prefix components are dot-separated object keys
+    or 'item' for each array element, e.g., 'item' for the items of a top-level array or
+    'results.item' for those of a SWAPI list response. When ijson is installed the document
+    is parsed incrementally (with its fastest available backend, yajl2_c if compiled) so
+    the full document is never held in memory; otherwise the document is read with
+    read_json().
+
+    Parameters:
+        filepath (str): path to file.
+        prefix (str): path to the values to be yielded. The default value is 'item'.
+
+    Returns:
+        generator: decoded values found at the prefix.
+    """
+
+    if ijson:
+        with open(filepath, 'rb') as file_obj:
+            yield from ijson.items(file_obj, prefix, use_float=True)
     else:
-        return False
+        yield from _iter_json_prefix(read_json(filepath), prefix.split('.') if prefix else [])
+
+
+def _iter_json_prefix(value, keys):
+    """Yields the values nested in a decoded JSON value at the given prefix
+    components, mirroring ijson.items() for the read_json() fallback.
+
+    Parameters:
+        value (object): decoded JSON value.
+        keys (list): remaining prefix components.
+
+    Returns:
+        generator: decoded values found at the prefix.
+    """
+
+    if not keys:
+        yield value
+    elif keys[0] == 'item' and isinstance(value, list):
+        for item in value:
+            yield from _iter_json_prefix(item, keys[1:])
+    elif isinstance(value, dict) and keys[0] in value:
+        yield from _iter_json_prefix(value[keys[0]], keys[1:])
 
 
 def read_csv_as_dict(path, delimiter=','):
     """Accepts a path, creates a file object, and returns a list of
-    dictionaries that represent the row values.
+    dictionaries that represent the row values. The parse is memoized
+    until the file is modified; each call returns fresh copies of the rows.
+
+    Parameters:
+        path (str): path to file
+        delimiter (str): delimiter that overrides the default delimiter
+
+    Returns:
+        list: nested dictionaries representing the file contents
+     """
+
+    rows = [dict(row) for row in _read_csv_as_dict(path, delimiter, os.path.getmtime(path))]
+    for row in rows:
+        if None in row: # extra values of a ragged row
+            row[None] = list(row[None])
+
+    return rows
+
+
+@functools.lru_cache(maxsize=32)
+def _read_csv_as_dict(path, delimiter, mtime):
+    """Memoized CSV parse underlying read_csv_as_dict(). The file's
+    modification time is part of the cache key so that edits to the
+    file invalidate the cached parse.
 
     Parameters:
         path (str): path to file
         delimiter (str): delimiter that overrides the default delimiter
+        mtime (float): file modification time
 
     Returns:
         list: nested dictionaries representing the file contents
      """
 
+    if os.path.getsize(path) > CSV_ARROW_MIN_SIZE:
+        data = _read_csv_with_arrow(path, delimiter)
+        if data is not None:
+            return data
+
+    return list(iter_csv_as_dict(path, delimiter))
+
+
+def _read_csv_with_arrow(path, delimiter):
+    """Parses a CSV file with pyarrow's multithreaded C++ reader. Every column
+    is read as a string so that rows match those yielded by iter_csv_as_dict().
+    Files pyarrow cannot represent the same way (ragged rows, duplicate or empty
+    headers, a UTF-8 BOM) are left to the csv module. pyarrow is imported on demand as its
+    import cost outweighs the gain on small files.
+
+    Parameters:
+        path (str): path to file
+        delimiter (str): delimiter that overrides the default delimiter
+
+    Returns:
+        list: nested dictionaries representing the file contents or None if
+              pyarrow is not installed or cannot parse the file equivalently
+     """
+
+    try:
+        import pyarrow
+        from pyarrow import csv as pyarrow_csv
+    except ImportError:
+        return None
+
     with open(path, 'r', newline='', encoding='utf-8') as csv_file:
-        data = []
-        reader = csv.DictReader(csv_file, delimiter=delimiter)
-        for line in reader:
-            data.append(dict(line)) # OrderedDict()
-            # data.append(dict(line)) # convert OrderedDict() to dict
+        header = next(csv.reader(csv_file, delimiter=delimiter), [])
 
-        return data
+    if not header or len(set(header)) != len(header):
+        return None
+    if header[0].startswith('\ufeff'): # pyarrow strips the BOM the csv module keeps
+        return None
+
+    try:
+        table = pyarrow_csv.read_csv(
+            path,
+            parse_options=pyarrow_csv.ParseOptions(delimiter=delimiter, newlines_in_values=True),
+            convert_options=pyarrow_csv.ConvertOptions(
+                column_types={name: pyarrow.string() for name in header},
+                strings_can_be_null=False
+            )
+        )
+    except pyarrow.ArrowInvalid: # e.g., ragged rows
+        return None
+
+    return table.to_pylist()
 
 
 def read_json(filepath):
     """
     This function reads a JSON document and returns a dictionary if provided with a valid
-    filepath.
+    filepath. The document is decoded with orjson when it is installed, directly from a
+    read-only memory map of the file so that its bytes are not copied into Python first
+    (non-empty regular files only; other files are read as usual). Documents orjson would
+    decode differently from the json module are decoded with json (see _loads()).
 
     Parameters:
         filepath (str): path to file.
@@ -186,16 +560,49 @@ def read_json(filepath):
         data: dictionary representations of the decoded JSON document.
     """
 
-    with open(filepath, 'r', encoding='utf-8') as file_obj:
-        data = json.load(file_obj)
+    if orjson:
+        with open(filepath, 'rb') as file_obj:
+            file_stat = os.fstat(file_obj.fileno())
+            if stat.S_ISREG(file_stat.st_mode) and file_stat.st_size > 0:
+                with mmap.mmap(file_obj.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+                        memoryview(mapped) as buffer:
+                    data = _loads(buffer)
+            else: # empty files, pipes and procfs files cannot be mapped
+                data = _loads(file_obj.read())
+    else:
+        with open(filepath, 'r', encoding='utf-8') as file_obj:
+            data = json.load(file_obj)
 
     return data
 
 
+def _loads(data):
+    """Decodes a UTF-8 JSON document the same way json.loads() does. orjson is
+    used unless it rejects the document (e.g., NaN or Infinity, which json accepts)
+    or the document holds a digit run long enough to be an integer beyond 64 bits
+    (which orjson decodes as a float); the json module decodes those documents.
+
+    Parameters:
+        data (bytes): the encoded JSON document.
+
+    Returns:
+        data: decoded JSON document.
+    """
+
+    if not _LONG_DIGITS.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+
+    return json.loads(str(data, 'utf-8'))
+
+
 def write_custom_json(filepath, obj):
     """Serializes complex objects (e.g., composite class instances) as JSON
-    by adding a CustomEncoder to the json.dump() call. Writes content to the
-    provided filepath.
+    by adding a default hook to the json.dumps() call. When orjson is installed
+    and can encode the object identically it is used instead. Writes the encoded
+    content to the provided filepath in a single write.
 
     Parameters:
         filepath (str): the path to the file.
@@ -205,5 +612,111 @@ def write_custom_json(filepath, obj):
         None
     """
 
-    with open(filepath, 'w', encoding='utf-8') as file_obj:
-        json.dump(obj, file_obj, cls=CustomEncoder, ensure_ascii=False, indent=2)
+    with open(filepath, 'wb') as file_obj:
+        file_obj.write(_dumps(obj))
+
+
+def write_custom_json_items(filepath, items):
+    """Serializes an iterable of complex objects (e.g., composite class instances)
+    as a JSON array, encoding and writing one item at a time so that the items are
+    never held in memory together. Accepts generators. The output is identical to
+    write_custom_json() called with a list of the same items.
+
+    Parameters:
+        filepath (str): the path to the file.
+        items (iterable): the items to be encoded as JSON and written to the file.
+
+    Returns:
+        None
+    """
+
+    with open(filepath, 'wb') as file_obj:
+        file_obj.write(b'[')
+        separator = b'\n'
+        for item in items:
+            encoded = _dumps(item)
+            file_obj.write(separator + b'  ' + encoded.replace(b'\n', b'\n  ')) # nest one level
+            separator = b',\n'
+        file_obj.write(b'\n]' if separator == b',\n' else b']')
+
+
+def _dumps(obj):
+    """Encodes an object as indented UTF-8 JSON, byte for byte the same as
+    json.dumps(obj, default=_jsonable_default, ensure_ascii=False, indent=2).
+    orjson is used when it is installed and _orjson_tree() finds nothing it
+    would encode differently (e.g., NaN, 1e+16, ints beyond 64 bits);
+    otherwise the json module encodes the object.
+
+    Parameters:
+        obj (object): the data to be encoded as JSON.
+
+    Returns:
+        bytes: the encoded JSON document
+    """
+
+    if orjson:
+        try:
+            return orjson.dumps(_orjson_tree(obj), option=orjson.OPT_INDENT_2)
+        except (TypeError, ValueError, RecursionError): # includes orjson.JSONEncodeError
+            pass
+
+    return json.dumps(obj, default=_jsonable_default, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def _orjson_tree(obj):
+    """Converts an object into plain dicts, lists, strings, numbers, booleans
+    and None, calling jsonable() on composite class instances and converting
+    dict keys as the json module does. Raises ValueError for any value orjson
+    would not encode exactly as json does, and TypeError for values json
+    cannot encode.
+
+    Parameters:
+        obj (object): the data to be converted.
+
+    Returns:
+        object: plain representation of the object
+    """
+
+    obj_type = type(obj)
+    if obj_type is str or obj_type is bool or obj is None:
+        return obj
+    if obj_type is int:
+        if not _ORJSON_INT_MIN <= obj <= _ORJSON_INT_MAX:
+            raise ValueError('int exceeds 64-bit range')
+        return obj
+    if obj_type is float:
+        if obj != 0.0 and not _ORJSON_FLOAT_MIN <= abs(obj) < _ORJSON_FLOAT_MAX: # also NaN, inf
+            raise ValueError('float is not encoded as float.__repr__()')
+        return obj
+    if obj_type is dict:
+        tree = {_orjson_key(key): _orjson_tree(value) for key, value in obj.items()}
+        if len(tree) != len(obj):
+            raise ValueError('dict keys collide once converted to str') # json writes both
+        return tree
+    if obj_type is list or obj_type is tuple:
+        return [_orjson_tree(value) for value in obj]
+
+    return _orjson_tree(_jsonable_default(obj))
+
+
+def _orjson_key(key):
+    """Converts a dict key to the str the json module writes for it.
+
+    Parameters:
+        key (object): dict key
+
+    Returns:
+        str: the converted key
+    """
+
+    key_type = type(key)
+    if key_type is str:
+        return key
+    if key_type is bool:
+        return 'true' if key else 'false'
+    if key is None:
+        return 'null'
+    if key_type is int:
+        return int.__repr__(key)
+
+    raise ValueError('key is left to the json module') # floats, unsupported types